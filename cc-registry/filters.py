@@ -1,39 +1,100 @@
 import os
 import markdown
 import yaml
+from collections import defaultdict
+from collections.abc import Hashable
+
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Rendered HTML of every tagged page, keyed by tag. Built once per mkdocs
+# build in define_env() so the macro does not re-walk the docs tree per call.
+_TAG_INDEX = defaultdict(list)
+
+# Per-file (mtime, size) -> (tags, html) so unchanged pages are not re-parsed
+# or re-rendered when mkdocs serve rebuilds the site.
+_PAGE_CACHE = {}
+
+# A single Markdown converter, reset between pages, avoids re-initialising
+# the parser for every page that markdown.markdown() would incur.
+_MD = markdown.Markdown()
 
 def extract_front_matter(md_content):
     """
     Extracts the YAML front matter from the given markdown content.
+    Only the front matter block is sliced out; the rest of the file is not split.
+    """
+    if not md_content.startswith('---\n'):
+        return {}, md_content  # Return empty dict if no front matter found
+    end_fm_index = md_content.find('\n---\n', 3)
+    if end_fm_index < 0:
+        if not md_content.endswith('\n---'):
+            return {}, md_content
+        end_fm_index = len(md_content) - 4
+    fm_content = md_content[4:end_fm_index]
+    try:
+        return yaml.load(fm_content, Loader=SafeLoader) or {}, md_content[end_fm_index+5:]
+    except yaml.YAMLError as e:
+        print(f"Error parsing YAML: {e}")
+    return {}, md_content
+
+def load_tagged_page(md_path):
+    """
+    Returns the tags and rendered HTML of a page, or ((), None) if it has no tags.
+    Results are cached by file mtime and size.
     """
-    lines = md_content.split('\n')
-    if lines[0] == '---':
-        end_fm_index = lines[1:].index('---') + 1
-        fm_content = '\n'.join(lines[1:end_fm_index])
-        try:
-            return yaml.safe_load(fm_content), '\n'.join(lines[end_fm_index+1:])
-        except yaml.YAMLError as e:
-            print(f"Error parsing YAML: {e}")
-    return {}, md_content  # Return empty dict if no front matter found
-
-def include_content_with_tag(config, tag):
-    content = ""
+    stat = os.stat(md_path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _PAGE_CACHE.get(md_path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    with open(md_path, 'rb') as file:
+        raw = file.read()
+    # Pages without front matter are skipped before decoding them
+    if raw.startswith(b'---\n'):
+        front_matter, body = extract_front_matter(raw.decode('utf-8'))
+        tags = front_matter.get('tags')
+    else:
+        tags = None
+    # A single tag may be given as a plain string rather than a list
+    if isinstance(tags, str):
+        tags = [tags]
+    # Only pages carrying at least one tag are worth rendering. Unhashable
+    # entries can't be looked up in the index, and no macro argument matches them.
+    page = ({tag for tag in tags if isinstance(tag, Hashable)}, _MD.reset().convert(body)) if tags else ((), None)
+    _PAGE_CACHE[md_path] = (stamp, page)
+    return page
+
+def build_tag_index(config):
+    """
+    Walks the docs tree once and indexes the rendered HTML of each page by its tags.
+    """
+    _TAG_INDEX.clear()
     for root, dirs, files in os.walk(config['docs_dir']):
+        # Don't descend into hidden directories such as .git or .cache
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
         for md_file in files:
             if md_file.endswith(".md"):
-                with open(os.path.join(root, md_file), 'r') as file:
-                    md_content = file.read()
-                    front_matter, body = extract_front_matter(md_content)
-                    # Check if 'tags' key exists and the specified tag is in the list
-                    if front_matter.get('tags') and tag in front_matter['tags']:
-                        html = markdown.markdown(body)
-                        content += html
-    return content
+                tags, html = load_tagged_page(os.path.join(root, md_file))
+                for tag in tags:
+                    _TAG_INDEX[tag].append(html)
+    return _TAG_INDEX
+
+def include_content_with_tag(tag):
+    """
+    Returns the rendered HTML of every page tagged with tag, from the index built in define_env().
+    """
+    return ''.join(_TAG_INDEX.get(tag, []))
 
 def define_env(env):
     """
     Called by the Macros plugin to define custom functions and variables.
     """
+    build_tag_index(env.conf)
+
     @env.macro
     def include_tagged_content(tag):
-        return include_content_with_tag(env.conf, tag)
+        return include_content_with_tag(tag)
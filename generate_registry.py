@@ -2,20 +2,64 @@ import re
 import yaml
 import shutil
 import fnmatch
+import functools
 import subprocess
 import os   
+import pathlib
+import json
+import hashlib
+import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import jinja2
 from collections import Counter
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
 import datetime
 
 
 from robot.api import TestSuite
+from robot.version import VERSION as robot_version
+
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# orjson is optional; the on-disk caches fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 github_token = os.getenv('GITHUB_TOKEN')
-headers = {}
+
+# One keep-alive session for all GitHub API calls, retrying transient errors
+github_session = requests.Session()
+github_session.mount('https://', HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])))
+# If the 'GITHUB_TOKEN' environment variable exists, add it as a Bearer token
+if github_token:
+    github_session.headers['Authorization'] = f'Bearer {github_token}'
+
+# Contributor responses are cached here with their ETag so later builds can
+# send conditional requests, which GitHub doesn't count against the rate limit
+github_cache_dir = '.gh_cache'
+
+# Parsed robot files are cached here, keyed by file name and content, so
+# unchanged codebundles are not re-parsed on the next build. Bump the
+# version whenever the shape of parse_robot_file()'s result changes.
+robot_parse_cache_dir = '.robot_parse_cache'
+robot_parse_cache_version = '2'
+
+# Parsed robot files already seen by this build, keyed by path, mtime and
+# size, so a file is parsed at most once per run. The cached dicts are
+# shared between callers.
+parsed_robot_files = {}
 
 
 # YAML file path
@@ -28,13 +72,42 @@ clone_dir = './cloned_repos'
 mkdocs_root='cc-registry'
 docs_dir='docs'
 
-# Tags
-all_support_tags = []
+# Tags, counted by frequency
+all_support_tags = Counter()
 support_tags_to_remove = []
 
 #Global CodeCollection Stats
 ## collection['slug'] is used as the unique key
 all_codecollection_stats={}
+all_codecollection_stats_lock = threading.Lock()
+
+# Compiled template bytecode is cached here so later builds skip compiling
+# the templates. Jinja keys each entry on the template source's checksum.
+# get_template() creates the directory, which Jinja needs to exist.
+jinja_bytecode_cache_dir = '.jinja_cache'
+
+# Shared Jinja2 environment; templates are compiled once and cached by the
+# environment for every later render. The templates don't change during a
+# build, so skip the per-render staleness check.
+jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader("."), auto_reload=False,
+                               bytecode_cache=jinja2.FileSystemBytecodeCache(jinja_bytecode_cache_dir))
+
+# Matches a Robot "*** Test Cases ***" or "*** Tasks ***" section header
+robot_tasks_header_re = re.compile(rb'^\*+\s*(test\s*cases?|tasks?)\b', re.IGNORECASE | re.MULTILINE)
+# Runs of non-word characters, collapsed to '_' in snake-cased task names
+non_word_re = re.compile(r'\W+')
+# Robot variable syntax stripped from task names, e.g. "${NAMESPACE}" -> "NAMESPACE"
+task_name_variable_re = re.compile(r'\$\{|\}')
+# Separators between entries of the "Supports" metadata
+support_tags_split_re = re.compile(r'\s*,\s*|\s+')
+
+# Robot task tags left out of a parsed file's tag list
+skipped_task_tags = frozenset(['skipped'])
+
+# Keyword arguments and names that flag a runbook as shown in the cheatsheet or raising issues
+cheatsheet_arg_markers = frozenset(['render_in_commandlist=true', 'show_in_rwl_cheatsheet=true'])
+issue_arg_markers = frozenset(['set_issue_title'])
+issue_name_markers = ('RW.CLI.Parse', 'RW.Core.Add Issue')
 
 
 
@@ -43,27 +116,66 @@ def parse_robot_file(fpath):
     Parses a robot file in to a python object that is
     json serializable, representing all kinds of interesting
     bits and pieces about the file contents (for UI purposes).
+
+    Has no side effects so it can run in a worker process; callers record
+    the support tags with record_support_tags(). Results are cached on disk
+    in robot_parse_cache_dir.
     """
+    with open(fpath, 'rb') as file:
+        robot_source = file.read()
+    # Robot refuses to build a suite without tests or tasks, so check for a
+    # task section with a cheap byte scan before running the full parser.
+    if not robot_tasks_header_re.search(robot_source):
+        print(f"Warning: No tasks found in {fpath}")
+        return {
+            "doc": "",
+            "type": os.path.splitext(os.path.basename(fpath))[0].lower(),
+            "tags": [],
+            "tasks": [],
+            "imports": []
+        }
+
+    # The clones are fresh every build, so key on content rather than mtime.
+    # The file name is part of the key since Robot derives the suite name from it.
+    cache_key = hashlib.blake2b(digest_size=20)
+    for part in (robot_parse_cache_version, robot_version, os.path.basename(fpath)):
+        cache_key.update(part.encode() + b'\0')
+    cache_key.update(robot_source)
+    cache_path = os.path.join(robot_parse_cache_dir, f'{cache_key.hexdigest()}.json')
+    try:
+        ret = read_json_file(cache_path)
+        # Mark the entry as used so prune_robot_parse_cache() keeps it
+        os.utime(cache_path)
+        return ret
+    except (OSError, ValueError):
+        pass
+
+    ret = _parse_robot_suite(fpath)
+    os.makedirs(robot_parse_cache_dir, exist_ok=True)
+    write_json_file(cache_path, ret)
+    return ret
+
+def _parse_robot_suite(fpath):
     suite = TestSuite.from_file_system(fpath)
     # pprint.pprint(dir(suite))
     ret = {}
     ret["doc"] = suite.doc  # The doc string
     ret["type"] = suite.name.lower()
-    ret["tags"] = []
 
     for k, v in suite.metadata.items():
-        if k.lower() in ["author", "name"]:
-            ret[k.lower()] = v
-        if k.lower() in ["display name", "name"]:
+        key = k.lower()
+        if key in ("author", "name"):
+            ret[key] = v
+        if key in ("display name", "name"):
             ret["display_name"] = v
-        if k.lower() in ["supports"]:
-            support_tags = re.split('\s*,\s*|\s+', v.strip().upper())
+        if key == "supports":
+            support_tags = support_tags_split_re.split(v.strip().upper())
             ret["support_tags"] = support_tags
-            all_support_tags.extend(support_tags)
     
     tasks = []
+    task_tags = set()
     for task in suite.tests:
-        tags = [str(tag) for tag in task.tags if tag not in ["skipped"]]
+        task_tags.update(str(tag) for tag in task.tags if tag not in skipped_task_tags)
         # print (task.body)
         tasks.append(
             {
@@ -71,10 +183,15 @@ def parse_robot_file(fpath):
                 "name": task.name,
                 # "tags": tags,
                 "doc": str(task.doc),
-                "keywords": task.body
+                # Plain name/args pairs rather than Robot model objects, which don't pickle
+                "keywords": [
+                    {"name": keyword.name, "args": tuple(keyword.args)}
+                    for keyword in task.body if hasattr(keyword, 'name')
+                ]
             }
         )
-        ret["tags"] = list(set(ret["tags"] + tags))
+    # Sorted so the output doesn't depend on set ordering
+    ret["tags"] = sorted(task_tags)
     ret["tasks"] = tasks
     resourcefile = suite.resource
     ret["imports"] = []
@@ -82,21 +199,112 @@ def parse_robot_file(fpath):
         ret["imports"].append(i.name)
     return ret
 
-def find_files(directory, pattern):
+def get_template(template_name):
+    """
+    Return a compiled template from the mkdocs templates directory.
     """
-    Search for files given directory and its subdirectories matching a pattern.
+    os.makedirs(jinja_bytecode_cache_dir, exist_ok=True)
+    return jinja_env.get_template(f"{mkdocs_root}/templates/{template_name}")
 
-    Args:
-        directory (str): The path of the directory to search.
+def prune_robot_parse_cache(used_since):
+    """
+    Remove cached robot parses that were not used since the given timestamp.
+    """
+    if not os.path.isdir(robot_parse_cache_dir):
+        return
+    for entry in os.scandir(robot_parse_cache_dir):
+        if entry.stat().st_mtime < used_since:
+            os.remove(entry.path)
+
+def record_support_tags(parsed_robot):
+    """
+    Add the support tags of a parsed robot file to the global tag counts.
+    """
+    all_support_tags.update(parsed_robot.get("support_tags", []))
+
+def _parsed_robot_file_key(fpath):
+    stat = os.stat(fpath)
+    return (os.path.abspath(fpath), stat.st_mtime_ns, stat.st_size)
+
+def get_parsed_robot_file(fpath):
+    """
+    Parse a robot file, reusing the result if it was already parsed in this run.
+    """
+    key = _parsed_robot_file_key(fpath)
+    if key not in parsed_robot_files:
+        parsed_robot_files[key] = parse_robot_file(fpath)
+    return parsed_robot_files[key]
+
+def parse_robot_files(fpaths, executor=None):
+    """
+    Parse several robot files, in parallel when a process pool is given.
+    Files already parsed in this run are reused. Results are returned in
+    the same order as fpaths.
+    """
+    keys = [_parsed_robot_file_key(fpath) for fpath in fpaths]
+    missing = [(fpath, key) for fpath, key in zip(fpaths, keys) if key not in parsed_robot_files]
+    missing_fpaths = [fpath for fpath, key in missing]
+    if executor is None:
+        results = map(parse_robot_file, missing_fpaths)
+    else:
+        results = executor.map(parse_robot_file, missing_fpaths, chunksize=4)
+    for (fpath, key), result in zip(missing, results):
+        parsed_robot_files[key] = result
+    return [parsed_robot_files[key] for key in keys]
+
+def collect_codecollection_files(repo_path):
+    """
+    Walk a cloned codecollection once and collect the files the generator needs.
 
     Returns:
-        A list of file paths that match the search criteria.
+        A dict with 'runbooks' (runbook.robot files under codebundles/),
+        'slis' (sli.robot files anywhere in the repo), 'robot_files' (every
+        .robot file in the repo) and 'genrules_by_bundle' (codebundle name ->
+        its .runwhen/generation-rules YAML files), each in the same top-down
+        order as os.walk, plus 'codebundle_count' (the number of directories
+        directly under codebundles/).
     """
-    matches = []
-    for root, dirnames, filenames in os.walk(directory):
-        for filename in fnmatch.filter(filenames, pattern):
-            matches.append(os.path.join(root, filename))
-    return matches
+    files = {'runbooks': [], 'slis': [], 'robot_files': [], 'genrules_by_bundle': defaultdict(list), 'codebundle_count': 0}
+    _collect_codecollection_files(repo_path, (), files)
+    return files
+
+def _collect_codecollection_files(directory, rel_parts, files):
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    in_codebundle = len(rel_parts) >= 2 and rel_parts[0] == 'codebundles'
+    in_genrules = in_codebundle and rel_parts[2:4] == ('.runwhen', 'generation-rules')
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if rel_parts == ('codebundles',):
+                files['codebundle_count'] += 1
+            # Like os.walk, don't follow symlinked directories. Git internals never hold robot files.
+            if not entry.is_symlink() and not (not rel_parts and entry.name == '.git'):
+                subdirs.append(entry)
+            continue
+        if entry.name.endswith('.robot'):
+            files['robot_files'].append(entry.path)
+        if entry.name == 'sli.robot':
+            files['slis'].append(entry.path)
+        elif entry.name == 'runbook.robot' and in_codebundle:
+            files['runbooks'].append(entry.path)
+        elif in_genrules and entry.name.endswith('.yaml'):
+            files['genrules_by_bundle'][rel_parts[1]].append(entry.path)
+    for subdir in subdirs:
+        _collect_codecollection_files(subdir.path, rel_parts + (subdir.name,), files)
+
+def get_codebundle_name(filepath, repo_path):
+    """
+    Return the name of the codebundle a file belongs to, i.e. the directory
+    under codebundles/ in the codecollection cloned at repo_path.
+    """
+    return os.path.relpath(filepath, repo_path).split(os.sep)[1]
 
 def clone_repository(git_url, clone_directory, ref='main'):
     """
@@ -108,36 +316,70 @@ def clone_repository(git_url, clone_directory, ref='main'):
     - clone_directory: The directory where the repository should be cloned.
     - ref: The name of the reference to clone. This can be a branch name, tag, or commit SHA. Defaults to 'main'.
     """
-    if not os.path.exists(clone_directory):
-        os.makedirs(clone_directory)
-    subprocess.run(['git', 'clone', '-b', ref, '--single-branch', git_url], cwd=clone_directory)
+    # exist_ok: collections from the same org are cloned into the same directory concurrently
+    os.makedirs(clone_directory, exist_ok=True)
+    # A blobless partial clone keeps the commit history needed by
+    # get_last_commit_date() but only downloads the blobs that get checked out.
+    clone_cmd = ['git', 'clone', '-b', ref, '--single-branch', git_url]
+    try:
+        subprocess.run(clone_cmd[:2] + ['--filter=blob:none'] + clone_cmd[2:], cwd=clone_directory,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Partial clone of {git_url} failed, retrying with a full clone: {e.stderr.strip()}")
+        clean_path(os.path.join(clone_directory, git_url.rstrip('/').split('/')[-1].replace('.git', '')))
+        subprocess.run(clone_cmd, cwd=clone_directory, check=True)
 
 
+def read_json_file(file_path):
+    """
+    Read a JSON file, raising OSError or ValueError if it is missing or invalid.
+    """
+    with open(file_path, 'rb') as file:
+        if orjson:
+            return orjson.loads(file.read())
+        return json.load(file)
+
+def write_json_file(file_path, data):
+    """
+    Write data to a JSON file atomically, so concurrent readers never see a partial file.
+    """
+    tmp_file_path = f'{file_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_file_path, 'wb') as file:
+        file.write(orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8'))
+    os.replace(tmp_file_path, file_path)
+
+def write_file(file_path, content):
+    """
+    Write rendered content to a file in a single call. A file that already
+    has this content is left untouched, so its mtime doesn't trigger a rebuild.
+    """
+    data = content.encode('utf-8')
+    try:
+        with open(file_path, 'rb') as file:
+            if file.read() == data:
+                return
+    except OSError:
+        pass
+    pathlib.Path(file_path).write_bytes(data)
+
 def read_yaml(file_path):
     """
     Read a YAML file and return the data.
     """
     with open(file_path, 'r') as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=SafeLoader)
 
 def generate_cc_list(data):
     """
     Generate Markdown content based on the provided data and a Jinja2 template file.
     """
-    cc_list_template_file_name=f"./{mkdocs_root}/templates/cc-list-template.j2"
-    cc_list_markdown_content = ""
-    cc_list_jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader("."))
-    cc_list_jinja_template = cc_list_jinja_env.get_template(cc_list_template_file_name)
+    cc_list_jinja_template = get_template("cc-list-template.j2")
     cc_list_content = cc_list_jinja_template.render(
         data=data,
         all_codecollection_stats=all_codecollection_stats
     )
-    with open(f'{mkdocs_root}/{docs_dir}/all_codecollections.md', 'w') as md_file:
-        md_file.write(cc_list_content)
-    cc_index_template_file_name=f"./{mkdocs_root}/templates/cc-index-template.j2"
-    cc_index_markdown_content = ""
-    cc_index_jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader("."))
-    cc_index_jinja_template = cc_index_jinja_env.get_template(cc_index_template_file_name)
+    write_file(f'{mkdocs_root}/{docs_dir}/all_codecollections.md', cc_list_content)
+    cc_index_jinja_template = get_template("cc-index-template.j2")
     for codecollection in data['codecollections']: 
         # print(codecollection)
         cc_index_file_path=f'{mkdocs_root}/{docs_dir}/CodeCollection/{codecollection["slug"]}/index.md'
@@ -145,8 +387,7 @@ def generate_cc_list(data):
             codecollection=codecollection,
             codecollection_stats=all_codecollection_stats[codecollection['slug']]
         )
-        with open(cc_index_file_path, 'w') as md_file:
-            md_file.write(cc_index_content)
+        write_file(cc_index_file_path, cc_index_content)
     # for collection in data.get('codecollections', []):
     #     markdown_content += jinja_template.render(**collection)
     # return cc_list_content
@@ -160,8 +401,14 @@ def clean_path(path):
     if os.path.exists(path):
         # Check if the path is a directory
         if os.path.isdir(path):
-            # Remove the directory and all its contents
-            shutil.rmtree(path)
+            # Move the directory out of the way, which is a single rename, and
+            # remove it and all its contents in the background. The hidden name
+            # keeps mkdocs from picking it up, and the thread is not a daemon so
+            # the removal always finishes before the process exits.
+            parent, name = os.path.split(os.path.normpath(path))
+            trash_path = os.path.join(parent, f'.{name}.trash-{os.getpid()}-{time.time_ns()}')
+            os.rename(path, trash_path)
+            threading.Thread(target=shutil.rmtree, args=(trash_path,), kwargs={'ignore_errors': True}).start()
             print(f"Directory '{path}' has been removed along with all its contents.")
         else:
             # It's a file, remove it
@@ -170,49 +417,52 @@ def clean_path(path):
     else:
         print(f"The path '{path}' does not exist.")
 
-def count_directories_at_depth_one(path):
-    # List everything in the given path
-    items = os.listdir(path)
-    # Count only those items which are directories
-    directory_count = sum(os.path.isdir(os.path.join(path, item)) for item in items)
-    return directory_count
-
-def generate_codebundle_content(collection, clone_path):
+def generate_codebundle_content(collection, clone_path, parse_executor=None):
     """
     Generate Markdown content based on the provided codebundle data and a Jinja2 template file.
+    Robot files are parsed on parse_executor when one is given.
+
+    Returns:
+        The files collected from the clone by collect_codecollection_files().
     """
     codecollection=collection["git_url"].split('/')[-1].replace('.git', '')
     codecollection_path = f'{mkdocs_root}/{docs_dir}/CodeCollection/{codecollection}/'
     clean_path(codecollection_path)
+    # Codebundle output directories created so far, shared by the runbook and SLI passes
+    codebundle_dirs = set()
+
+    # One walk of the clone finds the codebundles, runbooks, SLIs and generation rules
+    repo_path = f"{clone_path}/{codecollection}"
+    codecollection_files = collect_codecollection_files(repo_path)
+    genrules_by_bundle = codecollection_files['genrules_by_bundle']
 
     # Update the dictionary with the new or incremented count
-    codebundle_count = count_directories_at_depth_one(f"{clone_path}/{codecollection}/codebundles")
-    all_codecollection_stats[f"{collection['slug']}"]['total_codebundles'] += codebundle_count
+    all_codecollection_stats[f"{collection['slug']}"]['total_codebundles'] += codecollection_files['codebundle_count']
 
-    runbook_template_file_name=f"./{mkdocs_root}/templates/codebundle-runbook-template.j2"
-    runbook_jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader("."))
-    runbook_jinja_template = runbook_jinja_env.get_template(runbook_template_file_name)
-    runbook_files=find_files(f"{clone_path}/{codecollection}/codebundles", 'runbook.robot')
-    for runbook in runbook_files: 
-        codebundle=runbook.split('/')[5]
+    runbook_jinja_template = get_template("codebundle-runbook-template.j2")
+    runbook_files=codecollection_files['runbooks']
+    parsed_runbooks = parse_robot_files(runbook_files, parse_executor)
+    for runbook, parsed_runbook in zip(runbook_files, parsed_runbooks): 
+        record_support_tags(parsed_runbook)
+        codebundle=get_codebundle_name(runbook, repo_path)
 
         # Reset Genrules and Cheatsheet flags
         has_genrules = "false"
-        found_in_cheatsheet = "false"
-        raises_issues = "false"
+        found_in_cheatsheet = False
+        raises_issues = False
 
         # Find any genrules
-        gen_rules=find_files(f"{clone_path}/{codecollection}/codebundles/{codebundle}/.runwhen/generation-rules", '*.yaml')
-        if gen_rules != []: 
+        if genrules_by_bundle.get(codebundle):
             has_genrules = "true"
 
         # Generate the directory path
         meta_path=f'{clone_path}/{codecollection}/codebundles/{codebundle}/meta.yaml'
         # print(meta_path)
-        dir_path = f'{mkdocs_root}/docs/CodeCollection/{codecollection}/{codebundle}'
+        dir_path = f'{mkdocs_root}/{docs_dir}/CodeCollection/{codecollection}/{codebundle}'
         # Ensure the directory exists
-        os.makedirs(dir_path, exist_ok=True)
-        parsed_runbook = parse_robot_file(runbook)
+        if dir_path not in codebundle_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            codebundle_dirs.add(dir_path)
         runbook_source_url = f'{collection["git_url"]}/blob/main/codebundles/{codebundle}/runbook.robot'
         codecollection_total_tasks = all_codecollection_stats[f"{collection['slug']}"]['total_tasks'] + len(parsed_runbook["tasks"])
         all_codecollection_stats[f"{collection['slug']}"]['total_tasks']=codecollection_total_tasks
@@ -220,35 +470,39 @@ def generate_codebundle_content(collection, clone_path):
         if os.path.exists(meta_path):
             try:
                 with open(meta_path, 'r') as file:
-                    meta = yaml.safe_load(file)
+                    meta = yaml.load(file, Loader=SafeLoader)
             except yaml.YAMLError as e:
                 print(f"Error loading YAML file: {e}")
             except Exception as e:
                 print(f"Error reading file: {e}")
+        # Index meta.yaml commands by name for the per-task lookup below
+        meta_commands = {command["name"]: command for command in meta.get("commands", [])
+                         if isinstance(command, dict) and "name" in command}
         for task in parsed_runbook["tasks"]:
-            # Determine if any tasks are rendered in the cheatsheet
+            # Determine if any tasks are rendered in the cheatsheet or raise issues,
+            # stopping once both flags are set
             for keyword in task['keywords']:
-                if hasattr(keyword, 'name'):
-                    for item in ['render_in_commandlist=true', 'show_in_rwl_cheatsheet=true']:
-                        if item in keyword.args:
-                          found_in_cheatsheet = "true"
-                    for item in ['set_issue_title']:
-                        if item in keyword.args:
-                          raises_issues = "true"
-                    for item in ['RW.CLI.Parse', 'RW.Core.Add Issue']:
-                        if item in keyword.name:
-                          raises_issues = "true"
-
-            task_name_generalized = task["name"].replace('${', '').replace('}', '')
+                if found_in_cheatsheet and raises_issues:
+                    break
+                keyword_args = keyword['args']
+                if not found_in_cheatsheet and not cheatsheet_arg_markers.isdisjoint(keyword_args):
+                    found_in_cheatsheet = True
+                if not raises_issues:
+                    keyword_name = keyword['name']
+                    if (not issue_arg_markers.isdisjoint(keyword_args)
+                            or any(item in keyword_name for item in issue_name_markers)):
+                        raises_issues = True
+
+            task_name_generalized = task_name_variable_re.sub('', task["name"])
             task["task_name_generalized"] = task_name_generalized
-            task["name_snake_case"] = re.sub(r'\W+', '_', task_name_generalized.lower())
-            for command in meta["commands"]:
-                if command["name"] == task["name_snake_case"]:
-                    task["meta_explanation"] = command["explanation"]
-                    # Use .get() with a default of None or an empty string if you prefer
-                    useful_scenarios = command.get("when_is_it_useful", None)
-                    if useful_scenarios:
-                        task["meta_useful_scenarios"] = useful_scenarios
+            task["name_snake_case"] = non_word_re.sub('_', task_name_generalized.lower())
+            command = meta_commands.get(task["name_snake_case"])
+            if command:
+                task["meta_explanation"] = command["explanation"]
+                # Use .get() with a default of None or an empty string if you prefer
+                useful_scenarios = command.get("when_is_it_useful", None)
+                if useful_scenarios:
+                    task["meta_useful_scenarios"] = useful_scenarios
 
                 
         # print(parsed_runbook)
@@ -261,27 +515,26 @@ def generate_codebundle_content(collection, clone_path):
             total_tasks=len(parsed_runbook["tasks"]),
             file_path=file_path.replace(f'{mkdocs_root}/{docs_dir}', '').strip('.md'),
             has_genrules=has_genrules,
-            found_in_cheatsheet=found_in_cheatsheet,
-            raises_issues=raises_issues
+            found_in_cheatsheet="true" if found_in_cheatsheet else "false",
+            raises_issues="true" if raises_issues else "false"
         )
-        with open(file_path, 'w') as md_file:
-            md_file.write(runbook_codebundle_content)
-
-    sli_template_file_name=f"./{mkdocs_root}/templates/codebundle-sli-template.j2"
-    sli_jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader("."))
-    sli_jinja_template = sli_jinja_env.get_template(sli_template_file_name)
-    sli_files=find_files(f"{clone_path}/{codecollection}", 'sli.robot')
-    for sli in sli_files: 
-        codebundle=sli.split('/')[5]
-        gen_rules=find_files(f"{clone_path}/{codecollection}/codebundles/{codebundle}/.runwhen/generation-rules", '*.yaml')
+        write_file(file_path, runbook_codebundle_content)
+
+    sli_jinja_template = get_template("codebundle-sli-template.j2")
+    sli_files=codecollection_files['slis']
+    parsed_slis = parse_robot_files(sli_files, parse_executor)
+    for sli, parsed_sli in zip(sli_files, parsed_slis): 
+        record_support_tags(parsed_sli)
+        codebundle=get_codebundle_name(sli, repo_path)
         has_genrules = "false"
-        if gen_rules != []: 
+        if genrules_by_bundle.get(codebundle):
             has_genrules = "true"
         # Generate the directory path
         dir_path = f'{mkdocs_root}/{docs_dir}/CodeCollection/{codecollection}/{codebundle}'
         # Ensure the directory exists
-        os.makedirs(dir_path, exist_ok=True)
-        parsed_sli=parse_robot_file(sli)
+        if dir_path not in codebundle_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            codebundle_dirs.add(dir_path)
         sli_source_url = f'{collection["git_url"]}/blob/main/codebundles/{codebundle}/sli.robot'
         codecollection_total_tasks = all_codecollection_stats[f"{collection['slug']}"]['total_tasks'] + len(parsed_sli["tasks"])
         all_codecollection_stats[f"{collection['slug']}"]['total_tasks']=codecollection_total_tasks
@@ -295,19 +548,14 @@ def generate_codebundle_content(collection, clone_path):
             file_path=file_path.replace(f'{mkdocs_root}/{docs_dir}', '').strip('.md'),
             has_genrules=has_genrules
         )
-        with open(file_path, 'w') as md_file:
-            md_file.write(sli_codebundle_content)
+        write_file(file_path, sli_codebundle_content)
+    return codecollection_files
 
 def generate_index(all_support_tags_freq, all_codecollection_stats, top_latest_files, codecollections_yaml): 
     index_path = f'{mkdocs_root}/{docs_dir}/index.md'
     home_path = f'{mkdocs_root}/{docs_dir}/overrides/home.html'
-    index_template_file = f"{mkdocs_root}/templates/index-template.j2"
-    home_template_file = f"{mkdocs_root}/templates/home-template.j2"
-    index_env = jinja2.Environment(loader=jinja2.FileSystemLoader("."))
-    home_env = jinja2.Environment(loader=jinja2.FileSystemLoader("."))
-    index_template = index_env.get_template(index_template_file)
-    home_template = home_env.get_template(home_template_file)
-    current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    index_template = get_template("index-template.j2")
+    home_template = get_template("home-template.j2")
     
     top_10_support_tags = all_support_tags_freq.most_common(10)
     top_10_support_tag_names = [tag for tag, freq in top_10_support_tags]
@@ -319,9 +567,12 @@ def generate_index(all_support_tags_freq, all_codecollection_stats, top_latest_f
         "icon_url": tag_icon_url_map.get(tag)
     } for tag in top_10_support_tag_names]
 
-    total_contributors = sum(item['total_contributors'] for item in all_codecollection_stats.values())
-    total_tasks = sum(item['total_tasks'] for item in all_codecollection_stats.values())
-    total_codebundles = sum(item['total_codebundles'] for item in all_codecollection_stats.values())
+    # Sum the stats of every codecollection in a single pass
+    total_contributors = total_tasks = total_codebundles = 0
+    for item in all_codecollection_stats.values():
+        total_contributors += item['total_contributors']
+        total_tasks += item['total_tasks']
+        total_codebundles += item['total_codebundles']
     index_output = index_template.render(
         codecollections=codecollections_yaml.get('codecollections', []),
         tags_with_icons=tags_with_icons,
@@ -336,13 +587,33 @@ def generate_index(all_support_tags_freq, all_codecollection_stats, top_latest_f
         total_contributors=total_contributors
     )
 
-    with open(index_path, 'w') as index_file:
-        index_file.write(index_output)
-    index_file.close()
+    write_file(index_path, index_output)
 
-    with open(home_path, 'w') as home_file:
-        home_file.write(home_output)
-    home_file.close()
+    write_file(home_path, home_output)
+
+@functools.lru_cache(maxsize=None)
+def load_tag_icon_index(filename="map-tag-icons.yaml"):
+    """
+    Parse the tag icon YAML file once and index icon URLs by tag.
+
+    :param filename: The path to the YAML file.
+    :return: A dictionary of tags to their icon URLs, or None if the file could not be loaded.
+    """
+    try:
+        with open(filename, "r") as file:
+            data = yaml.load(file, Loader=SafeLoader)
+    except FileNotFoundError:
+        print(f"File {filename} not found.")
+        return None
+    except yaml.YAMLError as exc:
+        print(f"Error parsing YAML file: {exc}")
+        return None
+    tag_icon_index = {}
+    for icon in data.get("icons", []):
+        for tag in icon.get("tags", []):
+            # The first icon listing a tag wins
+            tag_icon_index.setdefault(tag, icon.get("url"))
+    return tag_icon_index
 
 def load_icon_urls_for_tags(tags, filename="map-tag-icons.yaml", default_url="https://storage.googleapis.com/runwhen-nonprod-shared-images/icons/tag.svg"):
     """
@@ -356,34 +627,40 @@ def load_icon_urls_for_tags(tags, filename="map-tag-icons.yaml", default_url="ht
     # Ensure tags is a list
     if isinstance(tags, str):
         tags = [tags]
-    
-    tag_icon_url_map = {}
-    try:
-        with open(filename, "r") as file:
-            data = yaml.safe_load(file)
-            icons = data.get("icons", [])
-            for tag in tags:
-                # Initialize each tag with a default URL
-                tag_icon_url_map[tag] = default_url
-                for icon in icons:
-                    if tag in icon.get("tags", []):
-                        # Update with specific URL if found
-                        tag_icon_url_map[tag] = icon.get("url")
-                        break
-    except FileNotFoundError:
-        print(f"File {filename} not found.")
-    except yaml.YAMLError as exc:
-        print(f"Error parsing YAML file: {exc}")
-    
-    return tag_icon_url_map
 
-def get_last_commit_date(repo_base, filepath):
-    relative_path = os.path.relpath(filepath, repo_base)
-    result = subprocess.run(['git', 'log', '-1', '--format=%ct', relative_path],
+    tag_icon_index = load_tag_icon_index(filename)
+    if tag_icon_index is None:
+        return {}
+    return {tag: tag_icon_index.get(tag, default_url) for tag in tags}
+
+def get_commit_dates(repo_base):
+    """
+    Map every path in a repository to the date of the last commit that touched it,
+    using a single git log pass over the history instead of one git process per file.
+
+    Returns:
+        A dict of repository-relative paths to datetimes.
+    """
+    # Commit lines start with a NUL so they can't be mistaken for file names.
+    # Rename detection would fetch blobs from the remote in a blobless clone.
+    result = subprocess.run(['git', '-c', 'core.quotePath=false', 'log', '--name-only', '--no-renames',
+                             '--format=%x00%ct'],
                             cwd=repo_base, capture_output=True, text=True)
-    timestamp = result.stdout.strip()
-    if timestamp:
-        return datetime.datetime.fromtimestamp(int(timestamp))
+    commit_dates = {}
+    commit_date = None
+    for line in result.stdout.splitlines():
+        if line.startswith('\0'):
+            commit_date = datetime.datetime.fromtimestamp(int(line[1:]))
+        elif line:
+            # History is walked newest first, so keep the first date seen
+            commit_dates.setdefault(line, commit_date)
+    return commit_dates
+
+def get_last_commit_date(repo_base, filepath, commit_dates):
+    relative_path = os.path.relpath(filepath, repo_base)
+    commit_date = commit_dates.get(relative_path)
+    if commit_date:
+        return commit_date
     else:
         print(f"Warning: No commit date found for {filepath}")
     return datetime.datetime.fromtimestamp(0)  # Using Unix epoch start time
@@ -413,19 +690,30 @@ def calculate_age(commit_date):
         return "Just now"
 
 
-def get_latest_files_by_pattern(repo_base, pattern='*', top_n=5):
+def get_latest_files_by_pattern(repo_base, pattern='*', top_n=5, filepaths=None):
+    """
+    Return the top_n most recently committed files in repo_base matching pattern.
+    When filepaths is given those files are filtered instead of walking repo_base.
+    """
     files_with_dates = []
-    for root, dirs, files in os.walk(repo_base):
-        for filename in fnmatch.filter(files, pattern):
-            filepath = os.path.join(root, filename)
-            commit_date = get_last_commit_date(repo_base, filepath)
+    commit_dates = get_commit_dates(repo_base)
+    codecollection = os.path.basename(os.path.normpath(repo_base))
+    if filepaths is None:
+        filepaths = [os.path.join(root, filename)
+                     for root, dirs, files in os.walk(repo_base)
+                     for filename in files]
+    for filepath in filepaths:
+        filename = os.path.basename(filepath)
+        if fnmatch.fnmatch(filename, pattern):
+            commit_date = get_last_commit_date(repo_base, filepath, commit_dates)
             if 'runbook' in filename: 
-                slug = f'/CodeCollection/{root.split("/")[3]}/{root.split("/")[5]}/tasks'
+                slug = f'/CodeCollection/{codecollection}/{get_codebundle_name(filepath, repo_base)}/tasks'
             elif 'sli' in filename: 
-                slug = f'/CodeCollection/{root.split("/")[3]}/{root.split("/")[5]}/health'
+                slug = f'/CodeCollection/{codecollection}/{get_codebundle_name(filepath, repo_base)}/health'
             else:
                 slug = "None"
-            parsed_robot_contents = parse_robot_file(filepath)
+            parsed_robot_contents = get_parsed_robot_file(filepath)
+            record_support_tags(parsed_robot_contents)
             if "display_name" in parsed_robot_contents:
                 name = f'{parsed_robot_contents["display_name"]}'
             else:
@@ -440,35 +728,84 @@ def get_latest_files_by_pattern(repo_base, pattern='*', top_n=5):
     files_with_dates.sort(reverse=True, key=lambda x: x['commit_date'])
     return files_with_dates[:top_n]
 
-def generate_github_stats(collection): 
-    # If the 'GITHUB_TOKEN' environment variable exists, add it as a Bearer token
-    if github_token:
-        headers['Authorization'] = f'Bearer {github_token}'
+def fetch_github_contributors(owner, repo):
+    """
+    Fetch the contributors of a GitHub repository, revalidating a cached
+    response with its ETag so unchanged lists are served from disk.
+    """
     github_api_url="https://api.github.com"
+    github_repo_api_contributors_url = f'{github_api_url}/repos/{owner}/{repo}/contributors'
+    cache_path = os.path.join(github_cache_dir, f'{owner}_{repo}_contributors.json')
+    cached = None
+    request_headers = {}
+    if os.path.exists(cache_path):
+        try:
+            cached = read_json_file(cache_path)
+            request_headers['If-None-Match'] = cached['etag']
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable cache file {cache_path}: {e}")
+            cached = None
+    try:
+        response = github_session.get(github_repo_api_contributors_url, params={'per_page': 100}, headers=request_headers)
+        if response.status_code == 304 and cached:
+            return cached['contributors']
+        response.raise_for_status()
+    except requests.RequestException as e:
+        # Fall back to the last good list, e.g. when rate limited or offline
+        if cached:
+            print(f"Warning: Fetching contributors for {owner}/{repo} failed, using cached contributors: {e}")
+            return cached['contributors']
+        raise
+    contributors = response.json()
+    etag = response.headers.get('ETag')
+    if etag:
+        os.makedirs(github_cache_dir, exist_ok=True)
+        write_json_file(cache_path, {'etag': etag, 'contributors': contributors})
+    return contributors
+
+def generate_github_stats(collection): 
     owner=collection["git_url"].split('/')[-2]
     repo=collection["git_url"].split('/')[-1].replace('.git', '')
-    github_repo_api_url = f'{github_api_url}/repos/{owner}/{repo}/contributors'
-    github_repo_api_contributors_url = f'{github_api_url}/repos/{owner}/{repo}/contributors'
-    contributors = requests.get(github_repo_api_contributors_url, headers=headers).json()
-    all_codecollection_stats[f"{collection['slug']}"]={
-            'total_contributors': len(contributors),
-            'contributors': [contributor['login'] for contributor in contributors],
-            'total_tasks': 0,
-            'total_codebundles': 0
-    }
+    contributors = fetch_github_contributors(owner, repo)
+    with all_codecollection_stats_lock:
+        all_codecollection_stats[f"{collection['slug']}"]={
+                'total_contributors': len(contributors),
+                'contributors': [contributor['login'] for contributor in contributors],
+                'total_tasks': 0,
+                'total_codebundles': 0
+        }
 
 def update_footer(): 
     current_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     build_date_path = f'{mkdocs_root}/{docs_dir}/overrides/partials/build_date.html'
-    build_date_template_file = f"{mkdocs_root}/templates/build_date.j2"
-    build_date_env = jinja2.Environment(loader=jinja2.FileSystemLoader("."))
-    build_date_template = build_date_env.get_template(build_date_template_file)
+    build_date_template = get_template("build_date.j2")
     build_date_output = build_date_template.render(
         current_date=current_date
     )
-    with open(build_date_path, 'w') as build_date_file:
-        build_date_file.write(build_date_output)
-    build_date_file.close()
+    write_file(build_date_path, build_date_output)
+
+def generate_category_page(support_tag, category_jinja_template):
+    """
+    Render and write the Categories page for a single support tag.
+    """
+    icon_url = load_icon_urls_for_tags(support_tag)    
+    file_path = f'{mkdocs_root}/{docs_dir}/Categories/{support_tag}.md'
+    category_content = category_jinja_template.render(
+        category_tag=support_tag, 
+        icon_url=icon_url
+    )
+    write_file(file_path, category_content)
+
+def process_collection(collection, clone_path, all_files_with_dates, parse_executor=None):
+    """
+    Generate codebundle content for a freshly cloned codecollection.
+    Its GitHub stats must already have been generated.
+    """
+    codecollection_files = generate_codebundle_content(collection, clone_path, parse_executor)
+    # Reuse the robot files found while generating content rather than walking the clone again
+    latest_files=get_latest_files_by_pattern(f'{clone_path}/{collection["git_url"].split("/")[-1]}', '*.robot', 5,
+                                             codecollection_files['robot_files'])
+    all_files_with_dates.extend(latest_files)
 
 
 def main():
@@ -481,21 +818,32 @@ def main():
     Args:
         args (str): The path the output contents from map-builder. 
     """
+    build_started = time.time()
     data = read_yaml(yaml_file_path)
     all_files_with_dates = []
     clean_path(clone_dir)
     clean_path(f"{mkdocs_root}/{docs_dir}/CodeCollection")
 
-    for collection in data.get('codecollections', []):
-        print(f"Cloning {collection['name']}...")
-        org= collection["git_url"].split("/")[-2]
-        ref = collection.get('git_ref', 'main')
-        clone_path=os.path.join(clone_dir, org)
-        clone_repository(collection['git_url'], clone_path, ref)
-        generate_github_stats(collection)
-        generate_codebundle_content(collection, clone_path)
-        latest_files=get_latest_files_by_pattern(f'{clone_path}/{collection["git_url"].split("/")[-1]}', '*.robot', 5)
-        all_files_with_dates.extend(latest_files)
+    collections = data.get('codecollections', [])
+    # Clones and GitHub API calls are network bound, so run them concurrently.
+    # Content generation stays on the main thread, in config order so the
+    # output is deterministic.
+    # Robot parsing is CPU bound, so it is spread over worker processes. Use
+    # spawn rather than fork since the clone threads are already running.
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as parse_executor, \
+            ThreadPoolExecutor(max_workers=max(1, min(16, len(collections)))) as executor:
+        clone_futures = {}
+        for collection in collections:
+            print(f"Cloning {collection['name']}...")
+            org= collection["git_url"].split("/")[-2]
+            ref = collection.get('git_ref', 'main')
+            clone_path=os.path.join(clone_dir, org)
+            stats_future = executor.submit(generate_github_stats, collection)
+            clone_futures[executor.submit(clone_repository, collection['git_url'], clone_path, ref)] = (collection, clone_path, stats_future)
+        for future, (collection, clone_path, stats_future) in clone_futures.items():
+            future.result()
+            stats_future.result()
+            process_collection(collection, clone_path, all_files_with_dates, parse_executor)
     
     cc_list_content = generate_cc_list(data)
 
@@ -503,34 +851,23 @@ def main():
     ## but calling them category tags in the app. 
     # Remove specific tags from all_tags
     for tag_to_remove in support_tags_to_remove:
-        all_support_tags.discard(tags_to_remove)  # discard does not raise an error if the element is not found
-
-
-    all_support_tags_freq = Counter(all_support_tags)
+        all_support_tags.pop(tag_to_remove, None)  # pop with a default does not raise an error if the tag is not found
 
     # Sort Global Tags
     # If you need a deduplicated list of tags, you can extract keys from the Counter
-    deduplicated_support_tags = list(all_support_tags_freq.keys())
+    deduplicated_support_tags = list(all_support_tags.keys())
 
     # Sorted list of unique tags, if needed
     sorted_support_tags = sorted(deduplicated_support_tags)
     directory_path = os.path.join(mkdocs_root, docs_dir, 'Categories')
     clean_path(directory_path)
 
-    for support_tag in sorted_support_tags: 
-        directory_path = os.path.join(mkdocs_root, docs_dir, 'Categories')
-        os.makedirs(directory_path, exist_ok=True)
-        icon_url = load_icon_urls_for_tags(support_tag)    
-        file_path = f'{mkdocs_root}/{docs_dir}/Categories/{support_tag}.md'
-        category_template_file_name=f"./{mkdocs_root}/templates/category-template.j2"
-        category_jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader("."))
-        category_jinja_template = category_jinja_env.get_template(category_template_file_name)
-        category_content = category_jinja_template.render(
-            category_tag=support_tag, 
-            icon_url=icon_url
-        )
-        with open(file_path, 'w') as md_file:
-            md_file.write(category_content)
+    os.makedirs(directory_path, exist_ok=True)
+    # Category pages are independent of each other, so render and write them concurrently
+    category_jinja_template = get_template("category-template.j2")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(functools.partial(generate_category_page, category_jinja_template=category_jinja_template),
+                          sorted_support_tags))
 
     # Determine last 5 updated codebundles across all codecollections
     # Sort all files by commit date in descending order
@@ -541,8 +878,9 @@ def main():
 
     
     # # Generate stats and home page
-    generate_index(all_support_tags_freq, all_codecollection_stats, top_latest_files, codecollections_yaml=data)
+    generate_index(all_support_tags, all_codecollection_stats, top_latest_files, codecollections_yaml=data)
     update_footer()
+    prune_robot_parse_cache(build_started)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file